@@ -1,16 +1,31 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
-import requests
 import sqlite3
 import threading
+import queue
+import time
 import sys
 import os
+import pathlib
 import platform
-from pynput import keyboard
-import json
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 import re
+import bisect
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
 
-if sys.platform == 'win32':
+_SYSTEM = platform.system()
+_IS_WIN = sys.platform == 'win32'
+_HOTKEY_COMBO = '<ctrl>+<alt>+d' if _SYSTEM != 'Darwin' else '<cmd>+<alt>+d'
+_SHORTCUT_TEXT = "Ctrl+Alt+D" if _SYSTEM != 'Darwin' else "Cmd+Alt+D"
+
+if _IS_WIN:
     import ctypes
     from ctypes import wintypes
     
@@ -23,14 +38,84 @@ if sys.platform == 'win32':
         user32.ShowWindow(hwnd, SW_SHOW)
         user32.SetActiveWindow(hwnd)
 
-class AutoHeightText(tk.Text):
-    def __init__(self, master=None, **kwargs):
-        super().__init__(master, **kwargs)
-        self.bind('<Configure>', self._adjust_height)
-    
-    def _adjust_height(self, event=None):
-        num_lines = self.count("1.0", "end", "displaylines")[0]
-        self.config(height=int(num_lines))
+    MONITOR_DEFAULTTONEAREST = 2
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", wintypes.RECT),
+            ("rcWork", wintypes.RECT),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    def cursor_monitor_workarea():
+        """Return (left, top, width, height) of the work area on the monitor under the mouse"""
+        user32 = ctypes.WinDLL('user32')
+        user32.MonitorFromPoint.restype = wintypes.HMONITOR
+        user32.GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(MONITORINFO)]
+        point = wintypes.POINT()
+        if not user32.GetCursorPos(ctypes.byref(point)):
+            raise ctypes.WinError()
+        monitor = user32.MonitorFromPoint(point, MONITOR_DEFAULTTONEAREST)
+        info = MONITORINFO(cbSize=ctypes.sizeof(MONITORINFO))
+        if not user32.GetMonitorInfoW(monitor, ctypes.byref(info)):
+            raise ctypes.WinError()
+        work = info.rcWork
+        return work.left, work.top, work.right - work.left, work.bottom - work.top
+
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA query_only=1",
+)
+
+SUGG_LIMIT = 8
+LEMMA_INDEX_SQL = "SELECT DISTINCT lemma_lower, lemma FROM lemma_synset ORDER BY lemma_lower"
+LEMMA_FETCH_SIZE = 10000
+# Prefix match as a range scan on the lemma_lower index; used until the in-memory index is available
+SUGGEST_SQL = (
+    "SELECT DISTINCT lemma_lower, lemma FROM lemma_synset "
+    "WHERE lemma_lower >= ? AND lemma_lower < ? ORDER BY lemma_lower LIMIT ?"
+)
+# Senses are grouped in SQL; synset ids follow WordNet order, so ORDER BY MIN(s.id) keeps the sense order.
+# Each synset's examples are a JSON array, so a group yields one array per merged synset.
+DEFINITION_SQL = (
+    "SELECT s.part_of_speech, s.definition, GROUP_CONCAT(s.examples, CHAR(31)) "
+    "FROM (SELECT DISTINCT synset_id FROM lemma_synset WHERE lemma_lower = ?) ls "
+    "JOIN synsets s ON s.id = ls.synset_id "
+    "GROUP BY s.part_of_speech, s.definition ORDER BY MIN(s.id)"
+)
+EXAMPLE_SEP = '\x1f'
+SUGG_CACHE_SIZE = 512
+DEFN_CACHE_SIZE = 256
+# Online results persist between runs in a small writable database beside the read-only dictionary
+API_CACHE_FILE = 'api_cache.db'
+API_CACHE_TTL = 30 * 24 * 3600
+API_CACHE_SCHEMA = "CREATE TABLE IF NOT EXISTS api_cache (word TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+API_CACHE_GET_SQL = "SELECT json FROM api_cache WHERE word = ? AND ts > ?"
+API_CACHE_PUT_SQL = "INSERT OR REPLACE INTO api_cache (word, json, ts) VALUES (?, ?, ?)"
+API_CACHE_PRUNE_SQL = "DELETE FROM api_cache WHERE ts <= ?"
+
+_POS_MAP = {
+    'n': 'Noun',
+    'v': 'Verb',
+    'a': 'Adjective',
+    's': 'Adjective Satellite',
+    'r': 'Adverb'
+}
+
+HOTKEY_POLL_MS = 50
+GRAB_RETRIES = 25  # Retries 20 ms apart while a popup waits to be mapped
+WHEEL_UNITS = 4  # Lines scrolled per wheel notch, as in Tk's own Text bindings
+PLACEHOLDER = "Type a word to define..."
+
+# Keys that edit the entry text without producing a printable character
+_EDIT_KEYSYMS = frozenset({"BackSpace", "Delete"})
+_CONTROL_MASK = 0x4  # Control held, e.g. Ctrl+V/X/Z changing the text
+_HAS_LETTER = re.compile(r'[A-Za-z]').search
 
 class QuickDefinitionApp:
     def __init__(self):
@@ -48,34 +133,64 @@ class QuickDefinitionApp:
             'warning': '#f59e0b',
         }
         
-        self.setup_fonts()
+        self._db_path = self.get_database_path()
+        self._db_exists = os.path.exists(self._db_path)
+        # Read-only, but not immutable: build_database.py may rewrite the file while the app keeps running,
+        # so SQLite must keep taking read locks and noticing changes
+        self._db_uri = pathlib.Path(self._db_path).absolute().as_uri() + "?mode=ro"
         self.ensure_data_directory()
         self.root = tk.Tk()
         self.root.withdraw()
+        self.setup_fonts()
+        self.setup_styles()
         self.root.protocol("WM_DELETE_WINDOW", self.quit)
-        self.screen_width = self.root.winfo_screenwidth()
-        self.screen_height = self.root.winfo_screenheight()
         self.input_window = None
         self.loading_window = None
         self.result_window = None
         self.error_window = None
         self.suggestion_popup = None
+        self.suggestions_visible = False
         self.suggestion_after_id = None
-        self.active_fetch_thread = None
+        self._input_mapped_focus = False
+        self._placeholder_on = False  # True while the entry shows PLACEHOLDER instead of user text
+        self._sugg_ewma = 0.05  # Smoothed suggestion query cost in seconds, drives the debounce delay
+        self._sugg_cache = OrderedDict()  # Lowercased prefix -> suggestions, LRU ordered
+        self._last_prefix = ''
+        self._last_results = []
+        self._scheduled_prefix = ''  # Prefix of the pending or last-run suggestion update
+        self._suggest_executor = ThreadPoolExecutor(max_workers=1)  # Database suggestion queries, kept off the Tk thread
+        self._lookup_queue = queue.Queue()
+        self._fetch_gen = 0  # Bumped per lookup; results from an older generation are dropped
         self.selected_suggestion_index = -1
         self.spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self.current_spinner_index = 0
+        self._spinner_cycle = itertools.cycle(self.spinner_frames)
+        self._spin_after_id = None
+        self._loading_visible = False
+        self._pending_scroll = 0.0
+        self._scroll_scheduled = False
         self.history = []  # Navigation history
+        self._db_conn = None  # Opened lazily by the lookup worker and reused across lookups
+        self._db_lock = threading.Lock()
+        self._defn_cache = OrderedDict()  # Lowercased word -> definition data, LRU ordered
+        self._defn_cache_lock = threading.Lock()
+        self._api_cache_conn = None
+        self._api_cache_lock = threading.Lock()
+        self._http = None  # Created by the lookup worker on its first online lookup
+        threading.Thread(target=self.lookup_worker, daemon=True).start()
+        self._lemmas_lower_bytes = []  # Sorted UTF-8 encoded lowercased lemmas, searched with bisect
+        self._lemmas_display = []  # Display form of each entry in _lemmas_lower_bytes
         self.setup_input_window()
         self.setup_hotkeys()
-        if not os.path.exists(self.get_database_path()):
+        if not self._db_exists:
             messagebox.showinfo(
                 "Database Not Found", 
                 "WordNet database not found. The app will use online API only.\n\nPlease run the database setup script (build_database.py) if you want offline functionality."
             )
+        else:
+            # Suggestions fall back to indexed SQL until the in-memory index is ready
+            threading.Thread(target=self.load_lemma_index, daemon=True).start()
 
     def setup_fonts(self):
-        system = platform.system()
         self.fonts = {
             'heading': ('Noto Sans', 16, 'bold'),
             'subheading': ('Noto Sans', 14, 'bold'),
@@ -83,8 +198,11 @@ class QuickDefinitionApp:
             'small': ('Noto Sans', 10),
             'tiny': ('Noto Sans', 9),
             'monospace': ('Monospace', 12),
+            'italic': ('Noto Sans', 12, 'italic'),
+            'close': ('Noto Sans', 16),
+            'icon': ('Noto Sans', 24),
         }
-        if system == 'Windows':
+        if _SYSTEM == 'Windows':
             self.fonts = {
                 'heading': ('Segoe UI', 16, 'bold'),
                 'subheading': ('Segoe UI', 14, 'bold'),
@@ -92,8 +210,11 @@ class QuickDefinitionApp:
                 'small': ('Segoe UI', 10),
                 'tiny': ('Segoe UI', 9),
                 'monospace': ('Consolas', 12),
+                'italic': ('Segoe UI', 12, 'italic'),
+                'close': ('Segoe UI', 16),
+                'icon': ('Segoe UI', 24),
             }
-        elif system == 'Darwin':
+        elif _SYSTEM == 'Darwin':
             self.fonts = {
                 'heading': ('SF Pro', 16, 'bold'),
                 'subheading': ('SF Pro', 14, 'bold'),
@@ -101,27 +222,135 @@ class QuickDefinitionApp:
                 'small': ('SF Pro', 10),
                 'tiny': ('SF Pro', 9),
                 'monospace': ('Menlo', 12),
+                'italic': ('SF Pro', 12, 'italic'),
+                'close': ('SF Pro', 16),
+                'icon': ('SF Pro', 24),
             }
+        # Resolve each role to a named Tk font once so widgets just reference it
+        self.fonts = {
+            role: tkfont.Font(
+                root=self.root,
+                family=spec[0],
+                size=spec[1],
+                weight='bold' if 'bold' in spec[2:] else 'normal',
+                slant='italic' if 'italic' in spec[2:] else 'roman',
+            )
+            for role, spec in self.fonts.items()
+        }
+
+    def setup_styles(self):
+        style = ttk.Style(self.root)
+        style.theme_use('clam')
+        style.configure("Shadcn.Vertical.TScrollbar", background=self.colors['background'], troughcolor=self.colors['background'], bordercolor=self.colors['background'], arrowcolor=self.colors['muted'], relief="flat")
+        # Shared widget options, built once and splatted into each widget that uses them
+        self._body_kw = dict(font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['text'])
+        button_kw = dict(font=self.fonts['small'], fg=self.colors['text'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6)
+        self._primary_btn_kw = dict(button_kw, bg=self.colors['primary'], activebackground=self.colors['secondary'])
+        self._secondary_btn_kw = dict(button_kw, bg=self.colors['card'], activebackground=self.colors['border'])
 
-    def get_database_path(self):
-        system = platform.system()
-        if system == 'Windows':
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_database_path():
+        if _SYSTEM == 'Windows':
             base_dir = os.path.join(os.environ.get('APPDATA', ''), 'QuickDefinition')
-        elif system == 'Darwin':
+        elif _SYSTEM == 'Darwin':
             base_dir = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', 'QuickDefinition')
         else:
             base_dir = os.path.join(os.path.expanduser('~'), '.quickdefinition')
         return os.path.join(base_dir, 'wordnet.db')
 
     def ensure_data_directory(self):
-        db_path = self.get_database_path()
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+
+    def load_lemma_index(self):
+        """Load every lemma once so prefix suggestions are an in-memory binary search"""
+        keys = []
+        words = []
+        try:
+            conn = sqlite3.connect(self._db_uri, uri=True)
+            try:
+                for pragma in DB_PRAGMAS:
+                    conn.execute(pragma)
+                cursor = conn.execute(LEMMA_INDEX_SQL)
+                rows = cursor.fetchmany(LEMMA_FETCH_SIZE)
+                while rows:
+                    for lemma_lower, lemma in rows:
+                        # UTF-8 preserves code point order, so the SQL ordering is valid for bytes too
+                        keys.append(lemma_lower.encode('utf-8'))
+                        words.append(lemma)
+                    rows = cursor.fetchmany(LEMMA_FETCH_SIZE)
+            finally:
+                # Suggestions never touch the database again once the index is built
+                conn.close()
+        except sqlite3.Error as e:
+            print("Error loading offline database (re-run build_database.py if it predates the current schema):", e)
+            # An unreadable or outdated file would fail every later query too, so stop trying it
+            self._db_exists = False
+            return
+        # Publish the display list first: _suggest() treats non-empty keys as a ready index
+        self._lemmas_display = words
+        self._lemmas_lower_bytes = keys
+
+    def _get_conn(self):
+        with self._db_lock:
+            if self._db_conn is None:
+                conn = sqlite3.connect(self._db_uri, uri=True, check_same_thread=False, isolation_level=None, cached_statements=64)
+                for pragma in DB_PRAGMAS:
+                    conn.execute(pragma)
+                self._db_conn = conn
+            return self._db_conn
+
+    def _get_api_cache_conn(self):
+        if self._api_cache_conn is None:
+            path = os.path.join(os.path.dirname(self._db_path), API_CACHE_FILE)
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(API_CACHE_SCHEMA)
+            # Expired rows are never read again; deleting them once per session lets their pages be reused
+            conn.execute(API_CACHE_PRUNE_SQL, (int(time.time()) - API_CACHE_TTL,))
+            self._api_cache_conn = conn
+        return self._api_cache_conn
+
+    def load_api_cache(self, key):
+        try:
+            with self._api_cache_lock:
+                row = self._get_api_cache_conn().execute(API_CACHE_GET_SQL, (key, int(time.time()) - API_CACHE_TTL)).fetchone()
+            return json_loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            print("Error reading API cache:", e)
+            return None
+
+    def store_api_cache(self, key, data):
+        try:
+            with self._api_cache_lock:
+                self._get_api_cache_conn().execute(API_CACHE_PUT_SQL, (key, json_dumps(data), int(time.time())))
+        except sqlite3.Error as e:
+            print("Error writing API cache:", e)
+
+    def _get_http(self):
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            # One keep-alive session so repeat API lookups reuse the TCP/TLS connection
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+            session.headers.update({"User-Agent": "QuickDefinition/1.0", "Accept-Encoding": "gzip"})
+            self._http = session
+        return self._http
 
     def setup_hotkeys(self):
-        system = platform.system()
-        hotkey_combo = '<ctrl>+<alt>+d' if system != 'Darwin' else '<cmd>+<alt>+d'
-        self.hotkey = keyboard.GlobalHotKeys({hotkey_combo: self.show_input})
+        # Registering the global hotkey can be slow (notably on X11), so do it once mainloop is running
+        self.hotkey = None
+        self._hotkey_queue = queue.Queue()
+        self.root.after(0, self._start_hotkey_listener)
+
+    def _start_hotkey_listener(self):
         try:
+            # pynput pulls in the platform input backend (Xlib, pyobjc, ...), so import it after the first paint
+            from pynput import keyboard
+            # The listener thread only enqueues; Tk work happens on the main thread in _drain_hotkey_queue
+            self.hotkey = keyboard.GlobalHotKeys({_HOTKEY_COMBO: lambda: self._hotkey_queue.put_nowait(True)})
+            self.hotkey.daemon = True
             self.hotkey.start()
         except Exception as e:
             print(f"Error setting up hotkey: {e}")
@@ -129,12 +358,42 @@ class QuickDefinitionApp:
                 "Hotkey Registration Failed", 
                 f"Failed to register global hotkey: {e}\n\nYou'll need to use the app interface directly."
             )
+            return
+        self._drain_hotkey_queue()
+
+    def _drain_hotkey_queue(self):
+        pressed = False
+        while True:
+            try:
+                pressed = self._hotkey_queue.get_nowait() or pressed
+            except queue.Empty:
+                break
+        if pressed:
+            self.show_input()
+        self.root.after(HOTKEY_POLL_MS, self._drain_hotkey_queue)
 
     def quit(self):
         try:
             self.hotkey.stop()
         except:
             pass
+        if self.suggestion_popup:
+            try:
+                self.suggestion_popup.destroy()
+            except tk.TclError:
+                pass
+            self.suggestion_popup = None
+        self._suggest_executor.shutdown(wait=False)
+        if self._http:
+            self._http.close()
+        with self._db_lock:
+            if self._db_conn:
+                self._db_conn.close()
+                self._db_conn = None
+        with self._api_cache_lock:
+            if self._api_cache_conn:
+                self._api_cache_conn.close()
+                self._api_cache_conn = None
         self.root.quit()
         self.root.destroy()
 
@@ -185,8 +444,7 @@ class QuickDefinitionApp:
         input_frame.pack(fill='x')
         self.entry = tk.Entry(input_frame, width=30, font=self.fonts['body'], bg=self.colors['input'], fg=self.colors['text'], bd=0, insertbackground=self.colors['text'])
         self.entry.pack(fill='both')
-        self.entry.insert(0, "Type a word to define...")
-        self.entry.config(fg=self.colors['muted'])
+        self.show_placeholder()
         self.entry.bind("<FocusIn>", self.on_entry_focus_in)
         self.entry.bind("<FocusOut>", self.on_entry_focus_out)
         self.entry.bind('<Return>', self.on_return)
@@ -196,27 +454,35 @@ class QuickDefinitionApp:
         self.entry.bind("<Up>", self.navigate_suggestions_up)
         self.entry.bind("<Tab>", self.select_current_suggestion)
         self.input_window.bind('<Escape>', lambda e: self.hide_input_window() or "break")
-        shortcut_text = "Ctrl+Alt+D" if platform.system() != 'Darwin' else "Cmd+Alt+D"
+        if _IS_WIN:
+            self.input_window.bind('<Map>', self.on_input_map)
         shortcut_frame = tk.Frame(content_frame, bg=self.colors['background'])
         shortcut_frame.pack(fill='x', padx=16, pady=(0, 8))
-        shortcut_label = tk.Label(shortcut_frame, text=f"Global: {shortcut_text} | Press Esc to close", font=self.fonts['tiny'], bg=self.colors['background'], fg=self.colors['muted'])
+        shortcut_label = tk.Label(shortcut_frame, text=f"Global: {_SHORTCUT_TEXT} | Press Esc to close", font=self.fonts['tiny'], bg=self.colors['background'], fg=self.colors['muted'])
         shortcut_label.pack(side='right')
         self.center_window(self.input_window, 400, 140)
 
+    def show_placeholder(self):
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, PLACEHOLDER)
+        self.entry.config(fg=self.colors['muted'])
+        self._placeholder_on = True
+        self._scheduled_prefix = ''
+
     def on_entry_focus_in(self, event):
-        if self.entry.get() == "Type a word to define...":
+        if self._placeholder_on:
             self.entry.delete(0, tk.END)
             self.entry.config(fg=self.colors['text'])
+            self._placeholder_on = False
 
     def on_entry_focus_out(self, event):
         if not self.entry.get():
-            self.entry.insert(0, "Type a word to define...")
-            self.entry.config(fg=self.colors['muted'])
-        if self.suggestion_popup:
+            self.show_placeholder()
+        if self.suggestions_visible:
             self.root.after(100, self.check_focus_for_suggestions)
 
     def on_return(self, event):
-        if self.suggestion_popup and self.selected_suggestion_index >= 0:
+        if self.suggestions_visible and self.selected_suggestion_index >= 0:
             return self.select_current_suggestion(event)
         else:
             self.fetch_definition()
@@ -224,29 +490,36 @@ class QuickDefinitionApp:
 
     def check_focus_for_suggestions(self):
         try:
-            if self.suggestion_popup and self.suggestion_popup.focus_get() is None:
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
-        except:
-            self.suggestion_popup = None
+            if self.suggestions_visible and self.suggestion_popup.focus_get() is None:
+                self.hide_suggestions()
+        except tk.TclError:
+            self.suggestions_visible = False
 
     def center_window(self, window, width, height):
-        x = (self.screen_width - width) // 2
-        y = (self.screen_height - height) // 3
+        # Measured per call so windows follow the active monitor and any resolution or scaling change
+        left, top = 0, 0
+        screen_width, screen_height = window.winfo_screenwidth(), window.winfo_screenheight()
+        if _IS_WIN:
+            try:
+                left, top, screen_width, screen_height = cursor_monitor_workarea()
+            except OSError:
+                pass
+        x = left + (screen_width - width) // 2
+        y = top + (screen_height - height) // 3
         window.geometry(f'{width}x{height}+{x}+{y}')
 
     def show_input(self):
         self.hide_all_windows()
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, "Type a word to define...")
-        self.entry.config(fg=self.colors['muted'])
+        self.show_placeholder()
+        self._input_mapped_focus = False
+        # Recentred on every show so the hotkey opens the input on the monitor under the mouse
+        self.center_window(self.input_window, 400, 140)
         self.input_window.deiconify()
-        if platform.system() == 'win32':
+        if _IS_WIN:
             self.input_window.attributes('-topmost', True)
             self.input_window.focus_force()
-            self.input_window.after(50, self.windows_force_focus)
-            self.input_window.after(150, self.windows_force_focus)
-            self.input_window.after(300, self.windows_force_focus)
+            # Focus is normally forced from <Map>; only retry if that event never arrived
+            self.input_window.after(150, self.windows_focus_fallback)
         else:
             self.input_window.lift()
             self.input_window.focus_force()
@@ -254,11 +527,21 @@ class QuickDefinitionApp:
             self.entry.selection_range(0, tk.END)
         self.input_window.grab_set()
 
+    def on_input_map(self, event):
+        # Child widgets report <Map> through the toplevel's bindtag too; act once per show_input
+        if event.widget is self.input_window and not self._input_mapped_focus:
+            self._input_mapped_focus = True
+            self.windows_force_focus()
+
+    def windows_focus_fallback(self):
+        if not self._input_mapped_focus:
+            self.windows_force_focus()
+
     def windows_force_focus(self):
         try:
             self.input_window.lift()
             self.input_window.focus_force()
-            if 'force_window_focus' in globals() and platform.system() == 'win32':
+            if _IS_WIN:
                 hwnd = int(self.input_window.winfo_id())
                 force_window_focus(hwnd)
             self.entry.focus_force()
@@ -275,7 +558,7 @@ class QuickDefinitionApp:
             current_state = self.entry["state"]
             self.entry.configure(state="disabled")
             self.entry.after(1, lambda: self.entry.configure(state=current_state))
-            if platform.system() == 'win32':
+            if _IS_WIN:
                 self.entry.after(5, lambda: self.input_window.lift())
         except tk.TclError:
             pass
@@ -287,29 +570,47 @@ class QuickDefinitionApp:
         self.input_window.grab_set()
         self.input_window.attributes('-topmost', True)
 
-    def hide_all_windows(self, clear_history=True):
-        if self.suggestion_popup:
+    def hide_suggestions(self):
+        # Whatever hid the popup (an accepted suggestion, Escape, no matches), the next edit must refresh it
+        self._scheduled_prefix = ''
+        # The popup is kept alive and only withdrawn so the native window can be reused
+        if self.suggestions_visible:
             try:
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
+                self.suggestion_popup.withdraw()
             except tk.TclError:
                 pass
+            self.suggestions_visible = False
+
+    def hide_all_windows(self, clear_history=True):
+        self.hide_suggestions()
+        self.hide_loading_window()
         for window in [self.result_window, self.error_window]:
-            if window:
-                try:
-                    window.destroy()
-                except tk.TclError:
-                    pass
+            self.withdraw_window(window)
         if clear_history:
             self.history = []
-        self.result_window = None
-        self.error_window = None
-        for window in [self.input_window, self.loading_window]:
-            if window:
-                try:
-                    window.withdraw()
-                except tk.TclError:
-                    pass
+        if self.input_window:
+            try:
+                self.input_window.withdraw()
+            except tk.TclError:
+                pass
+
+    def grab_when_viewable(self, window, attempts=GRAB_RETRIES):
+        """Grab input for a just-shown popup, retrying until the window manager has mapped it"""
+        try:
+            window.grab_set()
+        except tk.TclError:
+            # Only an unmapped window is worth retrying; a viewable one failed for another reason, e.g. a foreign grab
+            if attempts > 0 and window.state() != 'withdrawn' and not window.winfo_viewable():
+                window.after(20, self.grab_when_viewable, window, attempts - 1)
+
+    def withdraw_window(self, window):
+        """Hide a reusable popup, releasing its grab so other windows get input again"""
+        if window:
+            try:
+                window.grab_release()
+                window.withdraw()
+            except tk.TclError:
+                pass
 
     def hide_input_window(self):
         try:
@@ -317,29 +618,33 @@ class QuickDefinitionApp:
         except tk.TclError:
             pass
         self.input_window.withdraw()
-        if self.suggestion_popup:
-            try:
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
-            except tk.TclError:
-                pass
+        self.hide_suggestions()
 
     def on_key_release(self, event):
-        if event.keysym in ('Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R', 'Escape', 'Return', 'Up', 'Down', 'Tab'):
+        # Any typed character counts, including non-ASCII letters, punctuation and keypad keys
+        if not (event.char and event.char.isprintable()) and event.keysym not in _EDIT_KEYSYMS and not event.state & _CONTROL_MASK:
+            return
+        word = self.entry.get().strip()
+        if len(word) < 2 or self._placeholder_on:
+            self.cancel_suggestion_timer()
+            self.hide_suggestions()
             return
+        prefix = word.lower()
+        if prefix == self._scheduled_prefix:
+            return  # Already scheduled or shown, e.g. only a trailing space was typed
+        self.cancel_suggestion_timer()
+        self._scheduled_prefix = prefix
+        delay = int(max(50, min(400, self._sugg_ewma * 1000)))
+        self.suggestion_after_id = self.entry.after(delay, self.show_suggestions)
+
+    def cancel_suggestion_timer(self):
         if self.suggestion_after_id:
             self.entry.after_cancel(self.suggestion_after_id)
-        word = self.entry.get().strip()
-        if len(word) >= 2 and word != "Type a word to define...":
-            self.suggestion_after_id = self.entry.after(200, self.show_suggestions)
-        else:
-            if self.suggestion_popup:
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
+            self.suggestion_after_id = None
 
     def navigate_suggestions_down(self, event):
         """Navigate down through suggestions with Down arrow key"""
-        if self.suggestion_popup:
+        if self.suggestions_visible:
             if hasattr(self, 'suggestion_items') and self.suggestion_items:
                 self.selected_suggestion_index = (self.selected_suggestion_index + 1) % len(self.suggestion_items)
                 self.highlight_selected_suggestion()
@@ -348,7 +653,7 @@ class QuickDefinitionApp:
 
     def navigate_suggestions_up(self, event):
         """Navigate up through suggestions with Up arrow key"""
-        if self.suggestion_popup:
+        if self.suggestions_visible:
             if hasattr(self, 'suggestion_items') and self.suggestion_items:
                 if self.selected_suggestion_index <= 0:
                     self.selected_suggestion_index = len(self.suggestion_items) - 1
@@ -370,140 +675,228 @@ class QuickDefinitionApp:
                 label.configure(bg=self.colors['background'])
 
     def select_current_suggestion(self, event=None):
-        if self.suggestion_popup and self.selected_suggestion_index >= 0:
+        if self.suggestions_visible and self.selected_suggestion_index >= 0:
             try:
                 word = self.suggestion_items[self.selected_suggestion_index][1]['text']
                 self.entry.delete(0, tk.END)
                 self.entry.insert(0, word)
                 self.entry.configure(fg=self.colors['text'])
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
+                self.hide_suggestions()
                 self.selected_suggestion_index = -1
                 return "break"
             except (IndexError, KeyError, tk.TclError):
                 pass
         return None
 
+    def lookup_suggestions(self, prefix):
+        """Return suggestions for a lowercased prefix, from the cache when possible"""
+        suggestions = self._sugg_cache.get(prefix)
+        if suggestions is not None:
+            self._sugg_cache.move_to_end(prefix)
+            return suggestions
+        # A shorter prefix with fewer than SUGG_LIMIT hits already holds every match
+        for end in range(len(prefix) - 1, 1, -1):
+            shorter = self._sugg_cache.get(prefix[:end])
+            if shorter is not None and len(shorter) < SUGG_LIMIT:
+                suggestions = [w for w in shorter if w.lower().startswith(prefix)]
+                break
+        else:
+            if not self._lemmas_lower_bytes:
+                return None  # Only the database can answer until the index loads
+            t0 = time.perf_counter()
+            suggestions = self._suggest(prefix)
+            self.record_suggestion_cost(time.perf_counter() - t0)
+        self.cache_suggestions(prefix, suggestions)
+        return suggestions
+
+    def cache_suggestions(self, prefix, suggestions):
+        self._sugg_cache[prefix] = suggestions
+        if len(self._sugg_cache) > SUGG_CACHE_SIZE:
+            self._sugg_cache.popitem(last=False)
+
+    def query_suggestions(self, prefix):
+        """Run a database suggestion query on the executor and hand the rows back to Tk"""
+        try:
+            t0 = time.perf_counter()
+            suggestions = self._suggest(prefix)
+            cost = time.perf_counter() - t0
+        except Exception as ex:
+            print("Error fetching suggestions:", ex)
+            return
+        self.root.after(0, self.finish_suggestions, prefix, suggestions, cost)
+
+    def record_suggestion_cost(self, cost):
+        # The debounce tracks whichever path is answering now: the SQL range scan until the index loads, then the bisect
+        self._sugg_ewma += 0.5 * (1.2 * cost - self._sugg_ewma)
+
+    def finish_suggestions(self, prefix, suggestions, cost):
+        self.record_suggestion_cost(cost)
+        self.cache_suggestions(prefix, suggestions)
+        # Drop results the user has already typed past or closed the input for
+        if self.input_window.state() != 'normal' or self.entry.get().strip().lower() != prefix:
+            return
+        self.render_suggestions(prefix, suggestions)
+
+    def _suggest(self, prefix):
+        """Prefix matches from the in-memory index, or an indexed range scan before it is loaded"""
+        keys = self._lemmas_lower_bytes
+        if not keys:
+            conn = self._get_conn()
+            with self._db_lock:
+                rows = conn.execute(SUGGEST_SQL, (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1), SUGG_LIMIT))
+                return [lemma for _, lemma in rows]
+        key = prefix.encode('utf-8')
+        i = bisect.bisect_left(keys, key)
+        suggestions = []
+        while i < len(keys) and len(suggestions) < SUGG_LIMIT and keys[i].startswith(key):
+            suggestions.append(self._lemmas_display[i])
+            i += 1
+        return suggestions
+
     def show_suggestions(self):
+        self.suggestion_after_id = None
         word_fragment = self.entry.get().strip()
-        if len(word_fragment) < 2 or word_fragment == "Type a word to define...":
-            if self.suggestion_popup:
-                try:
-                    self.suggestion_popup.destroy()
-                except tk.TclError:
-                    pass
-                self.suggestion_popup = None
-            self.last_suggestions = []
+        if len(word_fragment) < 2 or self._placeholder_on:
+            self.hide_suggestions()
+            self._last_prefix = ''
+            self._last_results = []
             return
-        if not os.path.exists(self.get_database_path()):
+        if not self._db_exists:
             return
-        try:
-            conn = sqlite3.connect(self.get_database_path())
-            c = conn.cursor()
-            c.execute("SELECT DISTINCT lemma FROM definitions WHERE lemma LIKE ? COLLATE NOCASE LIMIT 8", (word_fragment + '%',))
-            suggestions = [row[0] for row in c.fetchall()]
-            conn.close()
-        except Exception as ex:
-            print("Error fetching suggestions:", ex)
-            suggestions = []
+        prefix = word_fragment.lower()
+        if self._last_prefix and prefix.startswith(self._last_prefix) and len(self._last_results) < SUGG_LIMIT:
+            # The previous results were complete, so the longer prefix can only narrow them
+            suggestions = [w for w in self._last_results if w.lower().startswith(prefix)]
+        else:
+            try:
+                suggestions = self.lookup_suggestions(prefix)
+            except Exception as ex:
+                print("Error fetching suggestions:", ex)
+                suggestions = []
+            if suggestions is None:
+                self._suggest_executor.submit(self.query_suggestions, prefix)
+                return
+        self.render_suggestions(prefix, suggestions)
+
+    def render_suggestions(self, prefix, suggestions):
+        self._last_prefix = prefix
         if not suggestions:
-            if self.suggestion_popup:
-                try:
-                    self.suggestion_popup.destroy()
-                except tk.TclError:
-                    pass
-                self.suggestion_popup = None
-            self.last_suggestions = []
+            self.hide_suggestions()
+            self._last_results = []
             return
-        if hasattr(self, 'last_suggestions') and self.last_suggestions == suggestions and self.suggestion_popup:
+        if self._last_results == suggestions and self.suggestions_visible:
             return
-        self.last_suggestions = suggestions
-        if self.suggestion_popup:
-            for child in self.suggestion_container.winfo_children():
-                child.destroy()
-            self.suggestion_items = []
-        else:
+        self._last_results = suggestions
+        if not self.suggestion_popup:
             self.suggestion_popup = tk.Toplevel(self.input_window)
+            self.suggestion_popup.withdraw()
             self.suggestion_popup.overrideredirect(True)
             self.suggestion_popup.configure(bg=self.colors['border'])
             self.suggestion_popup.attributes('-topmost', True)
-            x = self.input_window.winfo_x() + 16
-            y = self.input_window.winfo_y() + 95
-            width = self.input_window.winfo_width() - 32
-            popup_height = len(suggestions) * 36 + 8
-            self.suggestion_popup.geometry(f"{width}x{popup_height}+{x}+{y}")
             inner_frame = tk.Frame(self.suggestion_popup, bg=self.colors['background'], padx=1, pady=1)
             inner_frame.pack(fill='both', expand=True)
             self.suggestion_container = tk.Frame(inner_frame, bg=self.colors['background'])
             self.suggestion_container.pack(fill='both', expand=True)
-            self.suggestion_popup.bind('<Escape>', lambda event: (self.suggestion_popup.destroy() or "break"))
+            self.suggestion_popup.bind('<Escape>', lambda event: (self.hide_suggestions() or "break"))
+            # Build a fixed pool of rows once; updates only retext and show/hide them.
+            # Rows share one set of class bindings through the SuggestionRow bindtag.
+            for sequence, handler in (('<Enter>', self.on_suggestion_enter), ('<Leave>', self.on_suggestion_leave), ('<Button-1>', self.on_suggestion_click)):
+                self.root.bind_class('SuggestionRow', sequence, handler)
+            self.suggestion_rows = []
+            for index in range(SUGG_LIMIT):
+                item_frame = tk.Frame(self.suggestion_container, bg=self.colors['background'], padx=12, pady=8, height=36)
+                item_frame.pack_propagate(False)
+                label = tk.Label(item_frame, **self._body_kw, anchor='w')
+                label.pack(fill='both')
+                for widget in (item_frame, label):
+                    widget.row_index = index
+                    widget.bindtags(('SuggestionRow',) + widget.bindtags())
+                self.suggestion_rows.append((item_frame, label))
+            self._sugg_row_texts = [None] * SUGG_LIMIT
+            self._sugg_rows_shown = 0
         self.selected_suggestion_index = -1
-        self.suggestion_items = []
-        for suggestion in suggestions:
-            item_frame = tk.Frame(self.suggestion_container, bg=self.colors['background'], padx=12, pady=8, height=36)
-            item_frame.pack(fill='x')
-            item_frame.pack_propagate(False)
-            label = tk.Label(item_frame, text=suggestion, font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['text'], anchor='w')
-            label.pack(fill='both')
-            self.suggestion_items.append((item_frame, label))
-            def on_enter(_, frame=item_frame, lbl=label):
-                frame.configure(bg=self.colors['primary'])
-                lbl.configure(bg=self.colors['primary'])
-            def on_leave(_, frame=item_frame, lbl=label):
-                if self.selected_suggestion_index == -1 or frame != self.suggestion_items[self.selected_suggestion_index][0]:
-                    frame.configure(bg=self.colors['background'])
-                    lbl.configure(bg=self.colors['background'])
-            def on_click(_, word=suggestion):
-                self.entry.delete(0, tk.END)
-                self.entry.insert(0, word)
-                self.entry.configure(fg=self.colors['text'])
-                if self.suggestion_popup:
-                    self.suggestion_popup.destroy()
-                    self.suggestion_popup = None
-                self.entry.focus_set()
-            item_frame.bind('<Enter>', on_enter)
-            item_frame.bind('<Leave>', on_leave)
-            item_frame.bind('<Button-1>', on_click)
-            label.bind('<Enter>', on_enter)
-            label.bind('<Leave>', on_leave)
-            label.bind('<Button-1>', on_click)
-        self.suggestion_container.update_idletasks()
+        # Rows stay packed while the popup is hidden, so only the rows whose text or visibility changed are touched
+        shown = self._sugg_rows_shown
+        for index, (item_frame, label) in enumerate(self.suggestion_rows[:max(len(suggestions), shown)]):
+            if index < len(suggestions):
+                item_frame.configure(bg=self.colors['background'])
+                if self._sugg_row_texts[index] != suggestions[index]:
+                    self._sugg_row_texts[index] = suggestions[index]
+                    label.configure(text=suggestions[index], bg=self.colors['background'])
+                else:
+                    label.configure(bg=self.colors['background'])
+                if index >= shown:
+                    item_frame.pack(fill='x')
+            else:
+                item_frame.pack_forget()
+        self._sugg_rows_shown = len(suggestions)
+        self.suggestion_items = self.suggestion_rows[:len(suggestions)]
         x = self.input_window.winfo_x() + 16
         y = self.input_window.winfo_y() + 95
         width = self.input_window.winfo_width() - 32
-        actual_height = len(self.suggestion_items) * 36 + 8
-        self.suggestion_popup.geometry(f"{width}x{actual_height}+{x}+{y}")
+        height = len(suggestions) * 36 + 8
+        self.suggestion_popup.geometry(f"{width}x{height}+{x}+{y}")
+        if not self.suggestions_visible:
+            self.suggestion_popup.deiconify()
+            self.suggestions_visible = True
+
+    def on_suggestion_enter(self, event):
+        frame, label = self.suggestion_rows[event.widget.row_index]
+        frame.configure(bg=self.colors['primary'])
+        label.configure(bg=self.colors['primary'])
+
+    def on_suggestion_leave(self, event):
+        index = event.widget.row_index
+        if index != self.selected_suggestion_index:
+            frame, label = self.suggestion_rows[index]
+            frame.configure(bg=self.colors['background'])
+            label.configure(bg=self.colors['background'])
+
+    def on_suggestion_click(self, event):
+        word = self.suggestion_rows[event.widget.row_index][1]['text']
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, word)
+        self.entry.configure(fg=self.colors['text'])
+        self.hide_suggestions()
+        self.entry.focus_set()
 
     def fetch_definition(self, word=None):
         if word is None:
+            if self._placeholder_on:
+                return
             word = self.entry.get().strip()
-        if word == "Type a word to define..." or not word:
+        if not word:
             return
         self.hide_input_window()
-        if self.suggestion_popup and self.selected_suggestion_index >= 0:
+        if self.suggestions_visible and self.selected_suggestion_index >= 0:
             try:
                 word = self.suggestion_items[self.selected_suggestion_index][1]['text']
             except (IndexError, KeyError, tk.TclError):
                 pass
-            try:
-                self.suggestion_popup.destroy()
-                self.suggestion_popup = None
-            except tk.TclError:
-                pass
-        if self.active_fetch_thread and self.active_fetch_thread.is_alive():
-            return
+            self.hide_suggestions()
+        self._fetch_gen += 1
         self.hide_all_windows(clear_history=False)
         self.show_loading_window()
-        self.active_fetch_thread = threading.Thread(target=self.get_definition, args=(word,), daemon=True)
-        self.active_fetch_thread.start()
+        self._lookup_queue.put((self._fetch_gen, word))
 
-    def show_loading_window(self):
-        if self.loading_window:
+    def lookup_worker(self):
+        """Serve lookups from a single long-lived thread instead of one thread per word"""
+        while True:
+            gen, word = self._lookup_queue.get()
+            if gen != self._fetch_gen:
+                continue  # A newer lookup was requested while this one was queued
             try:
-                self.loading_window.destroy()
-            except tk.TclError:
-                pass
+                self.get_definition(word, gen)
+            except Exception as e:
+                print("Error looking up definition:", e)
+                # Never leave the loading window up: every lookup must end in finish_lookup
+                self.root.after(0, self.finish_lookup, gen, self.show_error, "An error occurred while looking up this word")
+
+    def _ensure_loading_window(self):
+        if self.loading_window:
+            return
         self.loading_window = tk.Toplevel(self.root)
+        self.loading_window.withdraw()
         self.loading_window.attributes('-topmost', True)
         self.loading_window.overrideredirect(True)
         self.loading_window.configure(bg=self.colors['background'])
@@ -511,95 +904,140 @@ class QuickDefinitionApp:
         border_frame.pack(fill='both', expand=True, padx=1, pady=1)
         content_frame = tk.Frame(border_frame, bg=self.colors['background'])
         content_frame.pack(fill='both', expand=True, padx=8, pady=8)
-        message_label = tk.Label(content_frame, text="Looking up definition", font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['text'])
+        message_label = tk.Label(content_frame, text="Looking up definition", **self._body_kw)
         message_label.pack(pady=(12, 8))
-        self.current_spinner_index = 0
-        spinner_font = self.fonts['heading'][0]
-        self.spinner_label = tk.Label(content_frame, text=self.spinner_frames[self.current_spinner_index], font=(spinner_font, 24), bg=self.colors['background'], fg=self.colors['primary'])
+        self._spin_var = tk.StringVar(self.loading_window)
+        self.spinner_label = tk.Label(content_frame, textvariable=self._spin_var, font=self.fonts['icon'], bg=self.colors['background'], fg=self.colors['primary'])
         self.spinner_label.pack(pady=(0, 12))
-        self.animate_spinner()
+
+    def show_loading_window(self):
+        self._ensure_loading_window()
+        self._spinner_cycle = itertools.cycle(self.spinner_frames)
+        self._spin_var.set(next(self._spinner_cycle))
+        if self._spin_after_id:
+            self.root.after_cancel(self._spin_after_id)
+        self._loading_visible = True
+        self._spin_after_id = self.root.after(100, self.animate_spinner)
         self.center_window(self.loading_window, 250, 110)
+        self.loading_window.deiconify()
         self.loading_window.focus_force()
-        self.loading_window.grab_set()
+        self.grab_when_viewable(self.loading_window)
 
     def animate_spinner(self):
-        if self.loading_window:
+        if self._loading_visible:
             try:
-                self.current_spinner_index = (self.current_spinner_index + 1) % len(self.spinner_frames)
-                self.spinner_label.config(text=self.spinner_frames[self.current_spinner_index])
-                self.loading_window.after(100, self.animate_spinner)
+                self._spin_var.set(next(self._spinner_cycle))
+                self._spin_after_id = self.root.after(100, self.animate_spinner)
             except tk.TclError:
                 pass
 
-    def get_definition(self, word):
-        if os.path.exists(self.get_database_path()):
+    def cached_definition(self, key):
+        with self._defn_cache_lock:
+            data = self._defn_cache.get(key)
+            if data is not None:
+                self._defn_cache.move_to_end(key)
+        return data
+
+    def cache_definition(self, key, data):
+        with self._defn_cache_lock:
+            self._defn_cache[key] = data
+            self._defn_cache.move_to_end(key)
+            if len(self._defn_cache) > DEFN_CACHE_SIZE:
+                self._defn_cache.popitem(last=False)
+
+    def group_definitions(self, definitions):
+        """Merge API definitions with identical text into the offline {definition, examples} shape"""
+        grouped_defs = {}
+        for defn in definitions:
+            def_text = defn.get('definition', '')
+            example = defn.get('example')
+            # Examples are dict keys so repeats are dropped in O(1) while keeping their order
+            ex_map = grouped_defs.setdefault(def_text, {})
+            if example:
+                ex_map[example] = None
+        return [{"definition": def_text, "examples": list(ex_map)} for def_text, ex_map in grouped_defs.items()]
+
+    def get_definition(self, word, gen):
+        key = word.lower()
+        data = self.cached_definition(key)
+        if data is not None:
+            self.root.after(0, self.finish_lookup, gen, self.show_results, data)
+            return
+        if self._db_exists:
             try:
-                conn = sqlite3.connect(self.get_database_path())
-                c = conn.cursor()
-                c.execute("SELECT lemma, part_of_speech, synset, definition, example FROM definitions WHERE lemma=? COLLATE NOCASE", (word,))
-                rows = c.fetchall()
-                conn.close()
-                if rows:
-                    meanings = {}
-                    for row in rows:
-                        lemma, pos, synset, definition_text, example_text = row
-                        if pos not in meanings:
-                            meanings[pos] = []
-                        def_obj = {"definition": definition_text}
-                        if example_text:
-                            def_obj["example"] = example_text
-                        meanings[pos].append(def_obj)
+                conn = self._get_conn()
+                meanings = defaultdict(list)
+                with self._db_lock:
+                    # Group rows as the cursor yields them instead of materialising them first
+                    for pos, definition_text, examples in conn.execute(DEFINITION_SQL, (key,)):
+                        examples = list(dict.fromkeys(ex for group in examples.split(EXAMPLE_SEP) for ex in json_loads(group))) if examples else []
+                        meanings[pos].append({"definition": definition_text, "examples": examples})
+                if meanings:
                     meanings_list = [{"partOfSpeech": pos, "definitions": defs} for pos, defs in meanings.items()]
                     data = {"word": word, "meanings": meanings_list}
-                    self.root.after(0, self.hide_loading_window)
-                    self.root.after(0, lambda: self.show_results(data))
+                    self.cache_definition(key, data)
+                    self.root.after(0, self.finish_lookup, gen, self.show_results, data)
                     return
             except Exception as e:
                 print("Error querying offline database:", e)
+        if gen != self._fetch_gen:
+            return
+        data = self.load_api_cache(key)
+        if data is not None:
+            self.cache_definition(key, data)
+            self.root.after(0, self.finish_lookup, gen, self.show_results, data)
+            return
         try:
+            import requests  # Imported on the first online lookup rather than at startup
             url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            response = requests.get(url, timeout=5)
-            data = response.json()
-            self.root.after(0, self.hide_loading_window)
+            response = self._get_http().get(url, timeout=5)
+            # 404 still carries a JSON body with a "title"; anything else unexpected is not worth parsing
+            if response.status_code not in (200, 404):
+                self.root.after(0, self.finish_lookup, gen, self.show_error, f"Dictionary service error ({response.status_code})")
+                return
+            data = json_loads(response.content)
             if isinstance(data, list) and data:
-                self.root.after(0, lambda: self.show_results(data[0]))
+                for meaning in data[0].get('meanings', []):
+                    meaning['definitions'] = self.group_definitions(meaning.get('definitions', []))
+                self.cache_definition(key, data[0])
+                self.root.after(0, self.finish_lookup, gen, self.show_results, data[0])
+                self.store_api_cache(key, data[0])
             elif isinstance(data, dict) and "title" in data:
-                self.root.after(0, lambda: self.show_error(data["title"]))
+                self.root.after(0, self.finish_lookup, gen, self.show_error, data["title"])
             else:
-                self.root.after(0, lambda: self.show_error("No definition found"))
-        except requests.RequestException:
-            self.root.after(0, self.hide_loading_window)
-            self.root.after(0, lambda: self.show_error("Network error occurred"))
+                self.root.after(0, self.finish_lookup, gen, self.show_error, "No definition found")
+        except ImportError:
+            self.root.after(0, self.finish_lookup, gen, self.show_error, "Online lookup unavailable")
+        except (requests.RequestException, ValueError):
+            self.root.after(0, self.finish_lookup, gen, self.show_error, "Network error occurred")
+
+    def finish_lookup(self, gen, show, arg):
+        """Swap the loading window for the outcome in one scheduled Tk callback"""
+        if gen != self._fetch_gen:
+            return
+        self.hide_loading_window()
+        show(arg)
 
     def hide_loading_window(self):
-        if self.loading_window:
-            try:
-                self.loading_window.destroy()
-                self.loading_window = None
-            except tk.TclError:
-                pass
+        self._loading_visible = False
+        if self._spin_after_id:
+            self.root.after_cancel(self._spin_after_id)
+            self._spin_after_id = None
+        self.withdraw_window(self.loading_window)
 
     def get_full_pos(self, pos):
-        mapping = {
-            'n': 'Noun',
-            'v': 'Verb',
-            'a': 'Adjective',
-            's': 'Adjective Satellite',
-            'r': 'Adverb'
-        }
-        return mapping.get(pos.lower(), pos.capitalize())
+        return _POS_MAP.get(pos.lower(), pos.capitalize()) if pos else pos
 
-    def show_results(self, data):
+    def _ensure_result_window(self):
+        """Build the result window once; later lookups only refill its contents"""
         if self.result_window:
-            try:
-                self.result_window.destroy()
-            except tk.TclError:
-                pass
+            return
         self.result_window = tk.Toplevel(self.root)
+        self.result_window.withdraw()
         self.result_window.attributes('-topmost', True)
         self.result_window.overrideredirect(True)
         self.result_window.configure(bg=self.colors['background'])
-        self.result_window.current_word = data.get('word', '').lower()
+        self.result_window.current_word = ''
         border_frame = tk.Frame(self.result_window, bg=self.colors['border'])
         border_frame.pack(fill='both', expand=True, padx=1, pady=1)
         main_frame = tk.Frame(border_frame, bg=self.colors['background'])
@@ -608,151 +1046,171 @@ class QuickDefinitionApp:
         header_frame.pack(fill='x', padx=24, pady=(24, 8))
         app_label = tk.Label(header_frame, text="QUICK DEFINITION", font=self.fonts['tiny'], bg=self.colors['background'], fg=self.colors['muted'])
         app_label.pack(anchor='w')
-        word_label = tk.Label(header_frame, text=data.get('word', '').capitalize(), font=self.fonts['heading'], bg=self.colors['background'], fg=self.colors['primary'])
-        word_label.pack(anchor='w', pady=(8, 4))
-        if 'phonetic' in data and data['phonetic']:
-            phonetic_label = tk.Label(header_frame, text=f"{data['phonetic']}", font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['muted'])
-            phonetic_label.pack(anchor='w', pady=(0, 8))
+        self._result_word_label = tk.Label(header_frame, font=self.fonts['heading'], bg=self.colors['background'], fg=self.colors['primary'])
+        self._result_word_label.pack(anchor='w', pady=(8, 4))
+        self._result_phonetic_label = tk.Label(header_frame, font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['muted'])
         content_frame = tk.Frame(main_frame, bg=self.colors['background'])
         content_frame.pack(fill='both', expand=True, padx=24, pady=(0, 16))
-        canvas = tk.Canvas(content_frame, bg=self.colors['background'], highlightthickness=0)
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure("Shadcn.Vertical.TScrollbar", background=self.colors['background'], troughcolor=self.colors['background'], bordercolor=self.colors['background'], arrowcolor=self.colors['muted'], relief="flat")
-        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=canvas.yview)
+        # All meanings are rendered as tagged runs in one Text widget rather than a widget per sense
+        text = tk.Text(content_frame, wrap=tk.WORD, width=1, height=1, **self._body_kw, bd=0, highlightthickness=0, padx=0, pady=0, cursor="xterm")
+        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=text.yview)
         try:
             scrollbar.configure(style="Shadcn.Vertical.TScrollbar")
         except tk.TclError:
             pass
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollable_frame = tk.Frame(canvas, bg=self.colors['background'])
-        scrollable_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=canvas.winfo_reqwidth())
-        def on_canvas_configure(event):
-            canvas.itemconfig(scrollable_window, width=event.width)
-        canvas.bind("<Configure>", on_canvas_configure)
-        def update_scrollbar_visibility():
-            bbox = canvas.bbox("all")
-            if bbox:
-                content_height = bbox[3] - bbox[1]
-                canvas_height = canvas.winfo_height()
-                if content_height > canvas_height:
-                    scrollbar.pack(side="right", fill="y")
-                else:
-                    scrollbar.pack_forget()
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            update_scrollbar_visibility()
-        scrollable_frame.bind("<Configure>", on_frame_configure)
-        def on_mousewheel(event):
-            if platform.system() == 'Darwin':
-                canvas.yview_scroll(int(-1*(event.delta)), "units")
+        scroll_pending = []
+        def update_scrollbar():
+            scroll_pending.clear()
+            first, last = text.yview()
+            if first <= 0.0 and last >= 1.0:
+                scrollbar.pack_forget()
             else:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        self.result_window.bind_all("<MouseWheel>", on_mousewheel)
-        self.result_window.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-        self.result_window.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
-        def cleanup_bindings():
-            try:
-                self.result_window.unbind_all("<MouseWheel>")
-                self.result_window.unbind_all("<Button-4>")
-                self.result_window.unbind_all("<Button-5>")
-            except tk.TclError:
-                pass
-        self.result_window.bind("<Destroy>", lambda e: cleanup_bindings())
-        for idx, meaning in enumerate(data.get('meanings', [])):
-            pos = meaning.get('partOfSpeech', '')
-            pos_label = tk.Label(scrollable_frame, text=self.get_full_pos(pos), font=self.fonts['subheading'], bg=self.colors['background'], fg=self.colors['warning'])
-            pos_label.pack(anchor='w', pady=(16 if idx > 0 else 0, 8))
-            divider = tk.Frame(scrollable_frame, height=1, bg=self.colors['border'])
-            divider.pack(fill='x', pady=(0, 12))
-            definitions = meaning.get('definitions', [])
-            grouped_defs = {}
-            for defn in definitions:
-                def_text = defn.get('definition', '')
-                example = defn.get('example')
-                if def_text in grouped_defs:
-                    if example and example not in grouped_defs[def_text]:
-                        grouped_defs[def_text].append(example)
-                else:
-                    grouped_defs[def_text] = []
-                    if example:
-                        grouped_defs[def_text].append(example)
-            i = 1
-            for def_text, examples in grouped_defs.items():
-                item_frame = tk.Frame(scrollable_frame, bg=self.colors['background'])
-                item_frame.pack(fill='x', pady=(0, 12), padx=(8, 0))
-                item_frame.grid_columnconfigure(1, weight=1)
-                
-                num_label = tk.Label(item_frame, text=f"{i}.", 
-                                    font=self.fonts['body'],
-                                    width=2, anchor='e',
-                                    bg=self.colors['background'], fg=self.colors['warning'])
-                num_label.grid(row=0, column=0, sticky='ne', padx=(0, 10))
-                
-                def_text_widget = AutoHeightText(item_frame, 
-                        font=self.fonts['body'],
-                        bg=self.colors['background'], fg=self.colors['text'],
-                        wrap=tk.WORD, width=50,
-                        borderwidth=0, highlightthickness=0)
-                def_text_widget.insert(tk.END, def_text)
-                def_text_widget.tag_configure("hover", foreground=self.colors['primary'], underline=1)
-                def_text_widget.config(state=tk.DISABLED)
-                def_text_widget.grid(row=0, column=1, sticky='w')
-                
-                # Bind hover events
-                def_text_widget.bind("<Motion>", 
-                                lambda e, tw=def_text_widget: self.on_text_hover(e, tw))
-                def_text_widget.bind("<Leave>", 
-                                lambda e, tw=def_text_widget: tw.tag_remove("hover", "1.0", "end"))
-                def_text_widget.bind('<Button-1>', 
-                                lambda e, tw=def_text_widget: self.on_definition_click(e, tw))
-                current_row = 1
-                for ex in examples:
-                    ex_label = tk.Label(item_frame, text=f'"{ex}"', font=(self.fonts['body'][0], self.fonts['body'][1], 'italic'), bg=self.colors['background'], fg=self.colors['muted'], wraplength=400, justify='left', anchor='w')
-                    ex_label.grid(row=current_row, column=1, sticky='w', pady=(4, 0))
-                    current_row += 1
-                i += 1
+                scrollbar.pack(side="right", fill="y", before=text)
+        def on_text_scroll(first, last):
+            scrollbar.set(first, last)
+            # Tk reports the view many times while text is inserted and laid out; repack once when idle
+            if not scroll_pending:
+                scroll_pending.append(text.after_idle(update_scrollbar))
+        text.configure(yscrollcommand=on_text_scroll)
+        text.pack(side="left", fill="both", expand=True)
+        text.tag_configure("pos", font=self.fonts['subheading'], foreground=self.colors['warning'], spacing3=8)
+        text.tag_configure("gap", spacing1=16)
+        text.tag_configure("divider", font=(self.fonts['tiny'].cget('family'), 1), background=self.colors['border'], spacing3=12)
+        text.tag_configure("item", lmargin1=8, lmargin2=36, tabs=(36,))
+        text.tag_configure("num", foreground=self.colors['warning'])
+        text.tag_configure("example", font=self.fonts['italic'], foreground=self.colors['muted'], lmargin1=36, lmargin2=36, spacing1=4)
+        text.tag_configure("item_end", spacing3=12)
+        text.tag_configure("hover", foreground=self.colors['primary'], underline=1)
+        text.bind("<Motion>", self.on_text_hover)
+        text.bind("<Leave>", self.on_text_leave)
+        text.bind('<Button-1>', self.on_definition_click)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            text.bind(sequence, self.on_result_wheel)
+        text._last_word_range = None
+        text._hover_range = None
+        self._result_text = text
         control_frame = tk.Frame(main_frame, bg=self.colors['background'])
         control_frame.pack(fill='x', padx=24, pady=(0, 16))
-        close_btn = tk.Button(control_frame, text="Close", font=self.fonts['small'], bg=self.colors['card'], fg=self.colors['text'], activebackground=self.colors['border'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6, command=self.close_result_window)
+        close_btn = tk.Button(control_frame, text="Close", **self._secondary_btn_kw, command=self.close_result_window)
         close_btn.pack(side='right')
-        search_btn = tk.Button(control_frame, text="New Search", font=self.fonts['small'], bg=self.colors['primary'], fg=self.colors['text'], activebackground=self.colors['secondary'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6, command=self.show_input)
+        search_btn = tk.Button(control_frame, text="New Search", **self._primary_btn_kw, command=self.show_input)
         search_btn.pack(side='right', padx=(0, 8))
-        if self.history:
-            go_back_btn = tk.Button(control_frame, text="Go Back", font=self.fonts['small'], bg=self.colors['card'], fg=self.colors['text'], activebackground=self.colors['border'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6, command=self.go_back)
-            go_back_btn.pack(side='right', padx=(0, 8))
-        exit_btn = tk.Button(header_frame, text="×", font=(self.fonts['heading'][0], 16), bg=self.colors['background'], fg=self.colors['muted'], activebackground=self.colors['error'], activeforeground=self.colors['text'], bd=0, command=self.close_result_window)
+        self._result_go_back_btn = tk.Button(control_frame, text="Go Back", **self._secondary_btn_kw, command=self.go_back)
+        exit_btn = tk.Button(header_frame, text="×", font=self.fonts['close'], bg=self.colors['background'], fg=self.colors['muted'], activebackground=self.colors['error'], activeforeground=self.colors['text'], bd=0, command=self.close_result_window)
         exit_btn.place(relx=1.0, rely=0.0, anchor='ne', width=30, height=30)
         self.result_window.bind('<Escape>', lambda e: (self.close_result_window() or "break"))
+
+    def show_results(self, data):
+        self._ensure_result_window()
+        self.result_window.current_word = data.get('word', '').lower()
+        self._result_word_label.config(text=data.get('word', '').capitalize())
+        if 'phonetic' in data and data['phonetic']:
+            self._result_phonetic_label.config(text=f"{data['phonetic']}")
+            self._result_phonetic_label.pack(anchor='w', pady=(0, 8), after=self._result_word_label)
+        else:
+            self._result_phonetic_label.pack_forget()
+        text = self._result_text
+        text.config(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text._last_word_range = None
+        text._hover_range = None
+        # Collect (text, tags) pairs and hand them to Tk in one insert call, however many senses there are
+        chunks = []
+        for idx, meaning in enumerate(data.get('meanings', [])):
+            pos = meaning.get('partOfSpeech', '')
+            chunks += (self.get_full_pos(pos) + "\n", ("pos", "gap") if idx > 0 else "pos", "\n", "divider")
+            for i, defn in enumerate(meaning.get('definitions', []), 1):
+                examples = defn.get('examples', [])
+                line_tags = ("item",) if examples else ("item", "item_end")
+                chunks += (f"{i}.\t", ("num",) + line_tags, defn.get('definition', ''), ("def",) + line_tags, "\n", line_tags)
+                for n, ex in enumerate(examples, 1):
+                    chunks += (f'"{ex}"\n', ("example", "item_end") if n == len(examples) else "example")
+        if chunks:
+            text.insert(tk.END, *chunks)
+        text.config(state=tk.DISABLED)
+        text.yview_moveto(0)
+        if self.history:
+            self._result_go_back_btn.pack(side='right', padx=(0, 8))
+        else:
+            self._result_go_back_btn.pack_forget()
         self.center_window(self.result_window, 550, 500)
-        self.result_window.update()
+        self.result_window.deiconify()
+        self.result_window.update_idletasks()
         self.result_window.focus_force()
-        self.result_window.grab_set()
+        self.grab_when_viewable(self.result_window)
+
+    def on_result_wheel(self, event):
+        """Accumulate wheel motion and scroll once per idle pass instead of once per event"""
+        if event.num == 4:
+            step = -WHEEL_UNITS
+        elif event.num == 5:
+            step = WHEEL_UNITS
+        elif _SYSTEM == 'Darwin':
+            step = -event.delta
+        else:
+            step = -event.delta / 120 * WHEEL_UNITS
+        self._pending_scroll += step
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self._result_text.after_idle(self.flush_result_scroll)
+        return "break"
 
-    def on_text_hover(self, event, text_widget):
+    def flush_result_scroll(self):
+        self._scroll_scheduled = False
+        units = int(self._pending_scroll)
+        self._pending_scroll -= units
+        if units:
+            self._result_text.yview_scroll(units, 'units')
+
+    def on_text_hover(self, event):
         """Handle hover effects on definition text"""
-        text_widget.tag_remove("hover", "1.0", "end")
+        text_widget = event.widget
         index = text_widget.index(f"@{event.x},{event.y}")
+        last = text_widget._last_word_range
+        if last and text_widget.compare(index, ">=", last[0]) and text_widget.compare(index, "<", last[1]):
+            return  # Still over the same word, so the hover state is already right
+        self.remove_hover_tag(text_widget)
+        if "def" not in text_widget.tag_names(index):
+            text_widget._last_word_range = None
+            text_widget.configure(cursor="xterm")
+            return
         start = text_widget.index(f"{index} wordstart")
         end = text_widget.index(f"{index} wordend")
+        text_widget._last_word_range = (start, end)
         word = text_widget.get(start, end).strip()
         
-        if word and re.search(r'[A-Za-z]', word):
+        if word and _HAS_LETTER(word):
             text_widget.configure(cursor="hand2")
             text_widget.tag_add("hover", start, end)
+            text_widget._hover_range = (start, end)
         else:
             text_widget.configure(cursor="xterm")
             
-    def on_definition_click(self, event, text_widget):
+    def remove_hover_tag(self, text_widget):
+        # Only the tagged word is cleared, and nothing is sent to Tk when no word is tagged
+        if text_widget._hover_range is not None:
+            text_widget.tag_remove("hover", *text_widget._hover_range)
+            text_widget._hover_range = None
+
+    def clear_text_hover(self, text_widget):
+        text_widget._last_word_range = None
+        self.remove_hover_tag(text_widget)
+
+    def on_text_leave(self, event):
+        self.clear_text_hover(event.widget)
+
+    def on_definition_click(self, event):
         """Handle clicks on words in definitions"""
-        text_widget.tag_remove("hover", "1.0", "end")
+        text_widget = event.widget
+        self.clear_text_hover(text_widget)
         index = text_widget.index(f"@{event.x},{event.y}")
+        if "def" not in text_widget.tag_names(index):
+            return
         start = text_widget.index(f"{index} wordstart")
         end = text_widget.index(f"{index} wordend")
         word = text_widget.get(start, end).strip()
         
-        if word and re.search(r'[A-Za-z]', word):
+        if word and _HAS_LETTER(word):
             current_window = text_widget.winfo_toplevel()
             previous_word = current_window.current_word
             self.history.append(previous_word)
@@ -761,18 +1219,22 @@ class QuickDefinitionApp:
     def go_back(self):
         if self.history:
             previous_word = self.history.pop()
-            self.fetch_definition(previous_word)
+            data = self.cached_definition(previous_word.lower())
+            if data is None:
+                self.fetch_definition(previous_word)
+                return
+            # The previous word was just shown, so redraw it from the cache without the loading window or lookup thread
+            self._fetch_gen += 1
+            self.show_results(data)
 
     def close_result_window(self):
         self.hide_all_windows()
 
-    def show_error(self, message):
+    def _ensure_error_window(self):
         if self.error_window:
-            try:
-                self.error_window.destroy()
-            except tk.TclError:
-                pass
+            return
         self.error_window = tk.Toplevel(self.root)
+        self.error_window.withdraw()
         self.error_window.attributes('-topmost', True)
         self.error_window.overrideredirect(True)
         self.error_window.configure(bg=self.colors['background'])
@@ -780,31 +1242,30 @@ class QuickDefinitionApp:
         border_frame.pack(fill='both', expand=True, padx=1, pady=1)
         main_frame = tk.Frame(border_frame, bg=self.colors['background'], padx=20, pady=20)
         main_frame.pack(fill='both', expand=True)
-        icon_label = tk.Label(main_frame, text="⚠️", font=(self.fonts['heading'][0], 24), bg=self.colors['background'], fg=self.colors['error'])
+        icon_label = tk.Label(main_frame, text="⚠️", font=self.fonts['icon'], bg=self.colors['background'], fg=self.colors['error'])
         icon_label.pack(pady=(0, 12))
-        message_label = tk.Label(main_frame, text=message, font=self.fonts['body'], bg=self.colors['background'], fg=self.colors['text'], wraplength=250, justify='center')
-        message_label.pack(pady=(0, 16))
+        self._error_message_label = tk.Label(main_frame, **self._body_kw, wraplength=250, justify='center')
+        self._error_message_label.pack(pady=(0, 16))
         button_frame = tk.Frame(main_frame, bg=self.colors['background'])
         button_frame.pack()
-        retry_btn = tk.Button(button_frame, text="Try Again", font=self.fonts['small'], bg=self.colors['primary'], fg=self.colors['text'], activebackground=self.colors['secondary'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6, command=self.show_input)
+        retry_btn = tk.Button(button_frame, text="Try Again", **self._primary_btn_kw, command=self.show_input)
         retry_btn.pack(side='left', padx=(0, 8))
-        close_btn = tk.Button(button_frame, text="Close", font=self.fonts['small'], bg=self.colors['card'], fg=self.colors['text'], activebackground=self.colors['border'], activeforeground=self.colors['text'], bd=0, padx=16, pady=6, command=self.close_error_window)
+        close_btn = tk.Button(button_frame, text="Close", **self._secondary_btn_kw, command=self.close_error_window)
         close_btn.pack(side='left')
         self.error_window.bind('<Escape>', lambda e: (self.close_error_window() or "break"))
         self.error_window.bind('<Return>', lambda e: self.show_input())
+
+    def show_error(self, message):
+        self._ensure_error_window()
+        self._error_message_label.config(text=message)
         self.center_window(self.error_window, 320, 200)
-        self.error_window.update()
+        self.error_window.deiconify()
+        self.error_window.update_idletasks()
         self.error_window.focus_force()
-        self.error_window.grab_set()
+        self.grab_when_viewable(self.error_window)
 
     def close_error_window(self):
-        if self.error_window:
-            try:
-                self.error_window.grab_release()
-                self.error_window.destroy()
-                self.error_window = None
-            except tk.TclError:
-                pass
+        self.withdraw_window(self.error_window)
 
 if __name__ == "__main__":
     app = QuickDefinitionApp()
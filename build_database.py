@@ -3,10 +3,21 @@ import sqlite3
 import os
 import sys
 import platform
+import json
 import nltk
 from nltk.corpus import wordnet
 import argparse
 
+# The file is written once and then only read, so favour load speed over crash safety while building
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+INSERT_BATCH_SIZE = 10000
+SCHEMA_VERSION = 1  # Bump when the table layout changes so existing databases are rebuilt
+
 def get_database_path():
     """Get appropriate database path for current platform"""
     system = platform.system()
@@ -24,6 +35,14 @@ def get_database_path():
     
     return os.path.join(base_dir, 'wordnet.db')
 
+def create_indices(c):
+    """Create lookup indices and refresh planner statistics"""
+    # Serves both prefix suggestions and exact lookups, which compare lemma_lower with BINARY collation.
+    # It also carries every lemma_synset column those queries read, so only synsets rows are fetched by id.
+    # Rows are deduplicated while loading, so the index can also enforce that each row is unique.
+    c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_lemma_cover ON lemma_synset(lemma_lower, synset_id, lemma)')
+    c.execute('ANALYZE')
+
 def setup_database(custom_path=None):
     """Create and populate WordNet database"""
     db_path = custom_path if custom_path else get_database_path()
@@ -41,50 +60,86 @@ def setup_database(custom_path=None):
     # Create database
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
-    
-    # Create table
+    for pragma in BUILD_PRAGMAS:
+        c.execute(pragma)
+    
+    # The first release kept one denormalized definitions table; later layouts are stamped in user_version.
+    # Either way the old data is rebuilt below.
+    c.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'definitions'")
+    old_definitions = c.fetchone()
+    version = c.execute('PRAGMA user_version').fetchone()[0]
+    if old_definitions or 0 < version < SCHEMA_VERSION:
+        print("Removing tables from an older build...")
+        for table in ('definitions', 'lemma_synset', 'synsets'):
+            c.execute(f'DROP TABLE IF EXISTS {table}')
+        conn.commit()
+        c.execute('VACUUM')
+    
+    # Create tables: each synset's text is stored once and lemmas refer to it by id
     c.execute('''
-    CREATE TABLE IF NOT EXISTS definitions (
+    CREATE TABLE IF NOT EXISTS synsets (
         id INTEGER PRIMARY KEY,
-        lemma TEXT,
         part_of_speech TEXT,
-        synset TEXT,
         definition TEXT,
-        example TEXT
+        examples TEXT
     )
     ''')
-    
-    # Create indices for faster lookup
-    c.execute('CREATE INDEX IF NOT EXISTS idx_lemma ON definitions(lemma)')
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS lemma_synset (
+        lemma TEXT,
+        lemma_lower TEXT,
+        synset_id INTEGER REFERENCES synsets(id)
+    )
+    ''')
+    c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    conn.commit()
     
     # Check if the database already has data
-    c.execute('SELECT COUNT(*) FROM definitions')
+    c.execute('SELECT COUNT(*) FROM lemma_synset')
     count = c.fetchone()[0]
     
     if count > 0:
         print(f"Database already contains {count} entries. Skip population? (y/n)")
         response = input().lower()
         if response == 'y':
+            create_indices(c)
+            conn.commit()
             conn.close()
             return
     
+    # Indices are built once after the load instead of being updated on every insert
+    c.execute('DROP INDEX IF EXISTS idx_lemma_cover')
+    c.execute('DELETE FROM lemma_synset')
+    c.execute('DELETE FROM synsets')
+    conn.commit()
+    
     # Populate the database with WordNet entries
     print("Populating database from WordNet...")
     
-    # Get all synsets
-    all_synsets = list(wordnet.all_synsets())
-    total = len(all_synsets)
+    synset_sql = 'INSERT INTO synsets (id, part_of_speech, definition, examples) VALUES (?, ?, ?, ?)'
+    lemma_sql = 'INSERT INTO lemma_synset (lemma, lemma_lower, synset_id) VALUES (?, ?, ?)'
+    synset_rows = []
+    rows = []
     
-    for i, synset in enumerate(all_synsets):
+    # One transaction for the whole load, with rows sent to SQLite in batches
+    c.execute('BEGIN')
+    # Stream synsets from WordNet rather than holding them all in a list
+    for i, synset in enumerate(wordnet.all_synsets()):
         # Show progress every 1000 synsets
         if i % 1000 == 0:
-            print(f"Processing synset {i+1}/{total}...")
+            print(f"Processing synset {i+1}...")
         
         pos = synset.pos()
         definition = synset.definition()
         examples = synset.examples()
         
-        # Get all lemmas for this synset
+        # Ids follow WordNet order, so lookups can order senses by synset id
+        synset_id = i + 1
+        # Examples are kept with their synset as one JSON array instead of one row each
+        synset_rows.append((synset_id, pos, definition, json.dumps(examples) if examples else None))
+        
+        # Get all lemmas for this synset, keeping one row per lemma
+        seen = set()
         for lemma in synset.lemma_names():
             # Skip very long words or phrases with spaces
             if len(lemma) > 50 or ' ' in lemma:
@@ -92,15 +147,26 @@ def setup_database(custom_path=None):
                 
             # Replace underscores with spaces
             lemma = lemma.replace('_', ' ')
+            if lemma in seen:
+                continue
+            seen.add(lemma)
             
-            # Insert into database
-            for example in examples or [None]:
-                c.execute('''
-                INSERT INTO definitions (lemma, part_of_speech, synset, definition, example)
-                VALUES (?, ?, ?, ?, ?)
-                ''', (lemma, pos, str(synset), definition, example))
-    
-    # Commit changes and close connection
+            rows.append((lemma, lemma.lower(), synset_id))
+        
+        if len(rows) >= INSERT_BATCH_SIZE:
+            c.executemany(synset_sql, synset_rows)
+            c.executemany(lemma_sql, rows)
+            synset_rows.clear()
+            rows.clear()
+    
+    if rows or synset_rows:
+        c.executemany(synset_sql, synset_rows)
+        c.executemany(lemma_sql, rows)
+    
+    # Commit changes, index the final table and close connection
+    conn.commit()
+    print("Building indices...")
+    create_indices(c)
     conn.commit()
     conn.close()
     